@@ -6,23 +6,29 @@
 # - Designed to run on Streamlit Community Cloud (free tier)
 
 import warnings
-warnings.filterwarnings("ignore")
 
 import streamlit as st
 import pandas as pd
 import numpy as np
-import requests
-import time
+import asyncio
 import json
-import networkx as nx
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timezone
+from pathlib import Path
+
+# networkx and plotly are imported lazily inside the builders that need them:
+# Streamlit re-executes this module on every rerun, and the cached builders
+# mean most reruns never touch those modules at all
 
 # --------------------------
 # Page config and header
 # --------------------------
-st.set_page_config(page_title="DevOps Pipeline Visualizer", layout="wide", page_icon="🚀")
+# Streamlit re-executes the module on every rerun; configure warnings and the
+# page once per session (a second set_page_config call would also raise)
+if "_page_configured" not in st.session_state:
+    warnings.filterwarnings("ignore")
+    st.set_page_config(page_title="DevOps Pipeline Visualizer", layout="wide", page_icon="🚀")
+    st.session_state["_page_configured"] = True
+
 st.title("🚀 DevOps Pipeline Visualizer — Resume Demo (Free Tier)")
 
 st.markdown(
@@ -37,8 +43,8 @@ st.markdown("---")
 # Sidebar controls
 # --------------------------
 st.sidebar.header("Controls")
-st.sidebar.markdown("Enter a public GitHub repository to fetch Actions runs (optional).")
-repo_input = st.sidebar.text_input("Public repo (owner/repo)", value="")
+st.sidebar.markdown("Enter one or more public GitHub repositories (comma-separated) to fetch Actions runs (optional).")
+repo_input = st.sidebar.text_input("Public repo(s) (owner/repo, owner/repo2)", value="")
 use_sim = st.sidebar.checkbox("Force simulator (don't call GitHub API)", value=True)
 refresh = st.sidebar.button("Refresh / Fetch")
 
@@ -50,55 +56,131 @@ st.sidebar.markdown("- `.github/workflows/ci.yml` sample is included")
 # --------------------------
 # Helper: fetch GitHub Actions runs (unauthenticated, low rate limit)
 # --------------------------
+GITHUB_REPO_API = "https://api.github.com/repos/{owner_repo}"
 GITHUB_RUNS_API = "https://api.github.com/repos/{owner_repo}/actions/runs?per_page=10"
+GITHUB_WORKFLOWS_API = "https://api.github.com/repos/{owner_repo}/actions/workflows"
+
+_GH_HEADERS = {"Accept": "application/vnd.github+json", "User-Agent": "devops-pipeline-visualizer"}
+ASYNC_CONCURRENCY = 8
+RUN_COLUMNS = ["id", "name", "status", "conclusion", "created_at", "updated_at", "run_number", "html_url"]
+
+async def _fetch_endpoints(repos, etags):
+    # httpx is only needed when a real fetch happens; the default
+    # force-simulator path never pays for the import
+    import httpx
+
+    # one client shares a single TLS handshake across every round-trip; all
+    # requests overlap behind one event-loop wait, bounded by the semaphore
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+
+    async def _get(client, url, headers=None):
+        async with sem:
+            return await client.get(url, headers=headers)
+
+    # http2: all gathered requests multiplex over one TLS connection;
+    # retries=2 re-attempts failed connects before giving up
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=2)
+    async with httpx.AsyncClient(transport=transport, headers=_GH_HEADERS, timeout=8) as client:
+        tasks = []
+        for repo in repos:
+            etag = etags.get(repo)
+            tasks += [
+                _get(client, GITHUB_RUNS_API.format(owner_repo=repo), {"If-None-Match": etag} if etag else None),
+                _get(client, GITHUB_REPO_API.format(owner_repo=repo)),
+                _get(client, GITHUB_WORKFLOWS_API.format(owner_repo=repo)),
+            ]
+        responses = await asyncio.gather(*tasks)
+    # regroup the flat response list into one (runs, meta, workflows) triple per repo
+    return [tuple(responses[i:i + 3]) for i in range(0, len(responses), 3)]
+
+def _parse_runs(repo: str, r):
+    if r.status_code == 304:
+        # unchanged since last fetch; 304 has no body and doesn't count against the rate limit
+        return st.session_state.get("gh_dfs", {}).get(repo, pd.DataFrame())
+    if r.status_code == 403 and r.headers.get("X-RateLimit-Remaining") == "0":
+        # out of unauthenticated quota (60/h) — don't retry, let the caller fall back
+        st.session_state["gh_rate_reset"] = r.headers.get("X-RateLimit-Reset")
+        raise RuntimeError("GitHub API rate limit exhausted")
+    r.raise_for_status()
+    runs = r.json().get("workflow_runs", [])
+    # normalize: from_records pulls the fixed schema out of the dicts in C,
+    # instead of per-field Python comprehensions
+    df = pd.DataFrame.from_records(runs, columns=RUN_COLUMNS + ["workflow_id"])
+    df["name"] = df["name"].fillna(df.pop("workflow_id"))
+    if not df.empty:
+        # explicit format avoids dateutil's slow per-row sniffing
+        for col in ("created_at", "updated_at"):
+            df[col] = pd.to_datetime(df[col], utc=True, format="%Y-%m-%dT%H:%M:%SZ", errors="coerce")
+    st.session_state.setdefault("gh_etags", {})[repo] = r.headers.get("ETag")
+    st.session_state.setdefault("gh_dfs", {})[repo] = df
+    return df
+
+# persist="disk" keeps results across container restarts on Streamlit Cloud,
+# where a cold start would otherwise re-spend the 60 req/h unauthenticated quota
+@st.cache_data(ttl=60 * 60, persist="disk", max_entries=32, show_spinner=False)
+def _fetch_github_actions(owner_repo: str):
+    # raises on any failure so errors and empty payloads never land in the cache
+    repos = [r.strip() for r in owner_repo.split(",") if r.strip()]
+    results = asyncio.run(_fetch_endpoints(repos, st.session_state.get("gh_etags", {})))
+    frames, metas = [], []
+    for repo, (r_runs, r_meta, r_wf) in zip(repos, results):
+        if r_meta.status_code == 200 and r_wf.status_code == 200:
+            meta = r_meta.json()
+            metas.append(
+                f"{repo}: ⭐ {meta.get('stargazers_count', 0)} · "
+                f"{r_wf.json().get('total_count', 0)} workflows · "
+                f"default branch {meta.get('default_branch', 'main')}"
+            )
+        df = _parse_runs(repo, r_runs)
+        if len(repos) > 1:
+            df = df.assign(repo=repo)
+        frames.append(df)
+    if metas:
+        st.session_state["gh_repo_meta"] = " | ".join(metas)
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    if df.empty:
+        raise RuntimeError("no workflow runs returned")
+    return df
 
-@st.cache_data(ttl=60)
 def fetch_github_actions(owner_repo: str):
-    # owner_repo: "owner/repo"
+    # owner_repo: "owner/repo", or a comma-separated list of repos
     try:
-        url = GITHUB_RUNS_API.format(owner_repo=owner_repo)
-        r = requests.get(url, timeout=8)
-        r.raise_for_status()
-        data = r.json()
-        runs = data.get("workflow_runs", [])
-        # normalize
-        rows = []
-        for run in runs:
-            rows.append({
-                "id": run.get("id"),
-                "name": run.get("name") or run.get("workflow_id"),
-                "status": run.get("status"),
-                "conclusion": run.get("conclusion"),
-                "created_at": run.get("created_at"),
-                "updated_at": run.get("updated_at"),
-                "run_number": run.get("run_number"),
-                "html_url": run.get("html_url")
-            })
-        df = pd.DataFrame(rows)
-        return df
+        return _fetch_github_actions(owner_repo)
     except Exception as e:
-        return pd.DataFrame()  # empty df on error
+        return pd.DataFrame()  # empty df on error; caller falls back to the simulator
 
 # --------------------------
 # Simulator functions (safe for free tier)
 # --------------------------
+@st.cache_data(ttl=3600)
 def simulated_ci_history(n=12):
     rng = np.random.default_rng(42)
-    times = pd.date_range(end=pd.Timestamp.now(tz=timezone.utc), periods=n, freq="H")
-    status = rng.choice(["completed", "completed", "completed", "in_progress", "queued"], size=n, p=[0.6,0.1,0.1,0.1,0.1])
-    conclusion = []
-    for s in status:
-        if s == "completed":
-            conclusion.append(rng.choice(["success","failure","neutral"], p=[0.7,0.2,0.1] if False else [0.75,0.2,0.05]))
-        else:
-            conclusion.append(None)
+    # datetime64 arange skips pandas' per-element Timestamp/tz machinery
+    # (np.datetime64 wants a naive UTC datetime, hence the tzinfo strip)
+    end = np.datetime64(datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None), "h")
+    times = pd.DatetimeIndex(end - np.arange(n - 1, -1, -1, dtype="timedelta64[h]"), tz="UTC")
+    # draw int8 codes and decode via Categorical at the very end: the hot path
+    # stays in 1-byte integers instead of object arrays of Python strings
+    STATUS = np.array(["completed", "in_progress", "queued"])
+    CONCLUSION = np.array(["success", "failure", "neutral"])
+    status_code = rng.choice(3, size=n, p=[0.8, 0.1, 0.1]).astype(np.int8)
+    concl_code = rng.choice(3, size=n, p=[0.75, 0.2, 0.05]).astype(np.int8)
+    # code -1 decodes to NaN, i.e. "no conclusion yet" for not-completed runs
+    concl_code = np.where(status_code == 0, concl_code, -1).astype(np.int8)
     df = pd.DataFrame({
         "time": times,
-        "status": status,
-        "conclusion": conclusion
+        "status": pd.Categorical.from_codes(status_code, STATUS),
+        "conclusion": pd.Categorical.from_codes(concl_code, CONCLUSION)
     })
     return df
 
+@st.cache_data(ttl=3600)
+def simulated_runs_table(n=12):
+    # pre-renamed and pre-sliced so the rerun path hands Streamlit exactly the
+    # rows it renders, with no per-rerun rename copy
+    return simulated_ci_history(n).rename(columns={"time": "created_at"}).head(10)
+
+@st.cache_data(ttl=3600)
 def simulate_build_logs():
     # small, short simulated build log for UI streaming
     steps = [
@@ -125,17 +207,19 @@ with col1:
     if repo_input and not use_sim:
         df_runs = fetch_github_actions(repo_input.strip())
         if df_runs.empty:
-            st.warning("No runs fetched (API rate-limit or repo not found). Use simulator or try again later.")
-            df_runs = simulated_ci_history().rename(columns={"time":"created_at"})
-        else:
-            # parse datetimes
-            if "created_at" in df_runs.columns:
-                df_runs["created_at"] = pd.to_datetime(df_runs["created_at"], errors="coerce")
+            reset = st.session_state.pop("gh_rate_reset", None)
+            if reset:
+                reset_at = datetime.fromtimestamp(int(reset), tz=timezone.utc).strftime("%H:%M:%S UTC")
+                st.warning(f"GitHub API rate limit reached; resets at {reset_at}. Showing simulator meanwhile.")
+            else:
+                st.warning("No runs fetched (API rate-limit or repo not found). Use simulator or try again later.")
+            df_runs = simulated_runs_table()
+        elif st.session_state.get("gh_repo_meta"):
+            st.caption(st.session_state["gh_repo_meta"])
         st.dataframe(df_runs.head(10))
     else:
         st.info("Showing simulated CI history (no GitHub fetch).")
-        df_sim = simulated_ci_history(12)
-        st.dataframe(df_sim.rename(columns={"time":"created_at"}))
+        st.dataframe(simulated_runs_table(12))
 
 with col2:
     st.markdown("**Pipeline KPIs (simulated)**")
@@ -157,12 +241,18 @@ log_col1, log_col2 = st.columns([3,1])
 with log_col1:
     if st.button("Simulate Build Log"):
         steps = simulate_build_logs()
-        log_area = st.empty()
-        log_text = ""
-        for step in steps:
-            log_text += f"> {datetime.now().strftime('%H:%M:%S')} - {step}\n"
-            log_area.code(log_text, language="bash")
-            time.sleep(0.6)
+        # one render; a tiny client-side ticker appends a line per 0.6s, with real
+        # timestamps, so the server never sleeps and never re-sends the log
+        st.components.v1.html(
+            "<pre id='log' style='background:#0e1117;color:#d4d4d4;padding:12px;"
+            "border-radius:6px;font-size:13px;font-family:monospace;margin:0;'></pre>"
+            f"<script>const steps={json.dumps(steps)};"
+            "let i=0;const el=document.getElementById('log');"
+            "const t=setInterval(()=>{if(i<steps.length){"
+            "el.textContent+='> '+new Date().toLocaleTimeString()+' - '+steps[i++]+'\\n';"
+            "}else{clearInterval(t);}},600);</script>",
+            height=300,
+        )
         st.success("Build simulation complete (logs streamed above).")
     else:
         st.info("Click 'Simulate Build Log' to stream a sample container build log.")
@@ -179,12 +269,19 @@ with log_col2:
 st.markdown("---")
 st.subheader("Pipeline Timeline (Simulated)")
 
-timeline_df = pd.DataFrame({
-    "stage": ["checkout", "install", "test", "build", "push", "deploy", "verify"],
-    "duration_min": [1, 2.5, 3.0, 4.2, 1.0, 2.0, 0.6]
-})
-fig_timeline = px.bar(timeline_df, x="stage", y="duration_min", title="Stage durations (minutes)")
-st.plotly_chart(fig_timeline, use_container_width=True)
+@st.cache_resource
+def build_timeline_figure():
+    import plotly.graph_objects as go
+
+    # 7 hard-coded rows: plain tuples into go.Bar skip DataFrame construction
+    # and plotly.express's figure introspection entirely
+    stages = ("checkout", "install", "test", "build", "push", "deploy", "verify")
+    durations = (1, 2.5, 3.0, 4.2, 1.0, 2.0, 0.6)
+    fig = go.Figure(go.Bar(x=stages, y=durations))
+    fig.update_layout(title="Stage durations (minutes)", xaxis_title="stage", yaxis_title="duration_min")
+    return fig
+
+st.plotly_chart(build_timeline_figure(), use_container_width=True)
 
 # --------------------------
 # Kubernetes cluster map (simulated)
@@ -192,60 +289,124 @@ st.plotly_chart(fig_timeline, use_container_width=True)
 st.markdown("---")
 st.subheader("Kubernetes Cluster Map (Simulated)")
 
-# build a small graph
-G = nx.DiGraph()
-G.add_node("cluster", type="cluster")
-G.add_node("node-1", type="node")
-G.add_node("node-2", type="node")
-G.add_node("pod-frontend", type="pod")
-G.add_node("pod-backend", type="pod")
-G.add_node("pod-db", type="pod")
-G.add_node("svc-frontend", type="service")
-
-G.add_edges_from([
-    ("cluster", "node-1"),
-    ("cluster", "node-2"),
-    ("node-1", "pod-frontend"),
-    ("node-1", "pod-backend"),
-    ("node-2", "pod-db"),
-    ("svc-frontend", "pod-frontend")
-])
-
-pos = nx.spring_layout(G, seed=42)
-node_x = []
-node_y = []
-node_text = []
-node_color = []
-for n in G.nodes():
-    x, y = pos[n]
-    node_x.append(x)
-    node_y.append(y)
-    typ = G.nodes[n].get("type", "pod")
-    node_text.append(f"{n} ({typ})")
-    color = {"cluster":"#114B5F", "node":"#028090", "pod":"#00A896", "service":"#02C39A"}.get(typ, "#00A896")
-    node_color.append(color)
-
-edge_x = []
-edge_y = []
-for e in G.edges():
-    x0, y0 = pos[e[0]]
-    x1, y1 = pos[e[1]]
-    edge_x += [x0, x1, None]
-    edge_y += [y0, y1, None]
-
-fig_graph = go.Figure()
-fig_graph.add_trace(go.Scatter(x=edge_x, y=edge_y, mode="lines", line=dict(width=1, color="#888"), hoverinfo="none"))
-fig_graph.add_trace(go.Scatter(
-    x=node_x, y=node_y,
-    mode="markers+text",
-    marker=dict(size=30, color=node_color, line=dict(width=2, color="#222")),
-    text=list(G.nodes()),
-    textposition="bottom center",
-    hovertext=node_text,
-    hoverinfo="text"
-))
-fig_graph.update_layout(title="Simulated K8s cluster topology", showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False), height=450)
-st.plotly_chart(fig_graph, use_container_width=True)
+# static 3-tier layout: cluster on top, nodes + service in the middle, pods at the bottom.
+# The topology is a compile-time constant, so no need to run a force-directed solver.
+K8S_POS = {
+    "cluster": (0.50, 1.00),
+    "node-1": (0.30, 0.55),
+    "node-2": (0.70, 0.55),
+    "svc-frontend": (0.02, 0.55),
+    "pod-frontend": (0.15, 0.10),
+    "pod-backend": (0.45, 0.10),
+    "pod-db": (0.70, 0.10),
+}
+
+# build a small graph (cached: graph + layout are constants, rebuild once per process)
+@st.cache_resource
+def build_k8s_graph():
+    import networkx as nx
+
+    G = nx.DiGraph()
+    G.add_node("cluster", type="cluster")
+    G.add_node("node-1", type="node")
+    G.add_node("node-2", type="node")
+    G.add_node("pod-frontend", type="pod")
+    G.add_node("pod-backend", type="pod")
+    G.add_node("pod-db", type="pod")
+    G.add_node("svc-frontend", type="service")
+
+    G.add_edges_from([
+        ("cluster", "node-1"),
+        ("cluster", "node-2"),
+        ("node-1", "pod-frontend"),
+        ("node-1", "pod-backend"),
+        ("node-2", "pod-db"),
+        ("svc-frontend", "pod-frontend")
+    ])
+
+    return G, K8S_POS
+
+@st.cache_data
+def build_cluster_arrays():
+    # returns plain lists/ndarrays only — friendly to st.cache_data's pickling,
+    # unlike the DiGraph itself (which stays behind the cache_resource builder)
+    G, pos = build_k8s_graph()
+    nodes = list(G.nodes())
+    coords = np.array([pos[n] for n in nodes])
+    node_x, node_y = coords[:, 0], coords[:, 1]
+    types = [G.nodes[n].get("type", "pod") for n in nodes]
+    node_text = [f"{n} ({typ})" for n, typ in zip(nodes, types)]
+    palette = {"cluster": "#114B5F", "node": "#028090", "pod": "#00A896", "service": "#02C39A"}
+    node_color = [palette.get(typ, "#00A896") for typ in types]
+
+    # edge segments as (x0, x1, nan) triples — NaN breaks the line between edges.
+    # Preallocate once and fill by strided slice assignment: one contiguous
+    # buffer per axis, gathered straight from the coordinate array.
+    name_to_idx = {n: i for i, n in enumerate(nodes)}
+    edges = np.array([(name_to_idx[a], name_to_idx[b]) for a, b in G.edges()])
+    edge_x = np.empty(3 * len(edges))
+    edge_y = np.empty(3 * len(edges))
+    edge_x[0::3] = coords[edges[:, 0], 0]
+    edge_x[1::3] = coords[edges[:, 1], 0]
+    edge_x[2::3] = np.nan
+    edge_y[0::3] = coords[edges[:, 0], 1]
+    edge_y[1::3] = coords[edges[:, 1], 1]
+    edge_y[2::3] = np.nan
+    return nodes, node_x, node_y, node_color, node_text, edge_x, edge_y
+
+@st.cache_resource
+def build_k8s_figure():
+    import plotly.graph_objects as go
+
+    nodes, node_x, node_y, node_color, node_text, edge_x, edge_y = build_cluster_arrays()
+    # Scattergl renders via WebGL (scales past SVG), and one constructor call
+    # avoids add_trace's O(n) copy of the trace tuple per call
+    edge_trace = go.Scattergl(x=edge_x, y=edge_y, mode="lines", line=dict(width=1, color="#888"), hoverinfo="skip")
+    node_trace = go.Scattergl(
+        x=node_x, y=node_y,
+        mode="markers+text",
+        marker=dict(size=30, color=node_color, line=dict(width=2, color="#222")),
+        text=nodes,
+        textposition="bottom center",
+        hovertext=node_text,
+        hoverinfo="text"
+    )
+    layout = go.Layout(title="Simulated K8s cluster topology", showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False), height=450)
+    return go.Figure(data=[edge_trace, node_trace], layout=layout)
+
+def render_topology(G, pos):
+    # Plotly installs per-point hit testing in the browser, which gets expensive on
+    # big graphs; past a few hundred nodes, hand the graph to VisJS (client-side
+    # force layout, progressive paint) or fall back to a static raster.
+    if len(G) > 200:
+        try:
+            from pyvis.network import Network
+        except ImportError:
+            Network = None
+        if Network is not None:
+            palette = {"cluster": "#114B5F", "node": "#028090", "pod": "#00A896", "service": "#02C39A"}
+            net = Network(height="450px", width="100%", directed=True, cdn_resources="remote")
+            net.from_nx(G)
+            for node in net.nodes:
+                node["color"] = palette.get(G.nodes[node["id"]].get("type", "pod"), "#00A896")
+            st.components.v1.html(net.generate_html(), height=470)
+            return
+        import io
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        fig, ax = plt.subplots(figsize=(9, 5))
+        nx.draw_networkx(G, pos=pos, ax=ax, node_size=60, font_size=6, arrows=False)
+        ax.axis("off")
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
+        plt.close(fig)
+        st.image(buf.getvalue(), use_container_width=True)
+    else:
+        st.plotly_chart(build_k8s_figure(), use_container_width=True)
+
+render_topology(*build_k8s_graph())
 
 # --------------------------
 # Quick interactive drills for interview/demo
@@ -295,123 +456,17 @@ st.caption("Demo by Amit — DevOps Pipeline Visualizer. All free & open source.
 # -----------------------
 # BEAUTIFUL, LIGHTWEIGHT LAYMAN GUIDE (for bottom of page)
 # -----------------------
-user_guide_html = """
-<style>
-.user-guide {
-    background: linear-gradient(145deg, #fefefe, #f5faff);
-    border-radius: 16px;
-    padding: 28px;
-    box-shadow: 0 6px 24px rgba(0,0,0,0.06);
-    font-family: "Segoe UI", Roboto, Arial, sans-serif;
-    margin-top: 40px;
-    border: 1px solid rgba(200, 220, 255, 0.4);
-}
-
-.user-guide h2 {
-    text-align: center;
-    font-size: 1.6rem;
-    margin-bottom: 18px;
-    color: #0a3d62;
-    background: linear-gradient(90deg, #00b4db, #0083b0);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-}
-
-.user-guide ol {
-    counter-reset: step;
-    padding-left: 0;
-}
-
-.user-guide li {
-    list-style: none;
-    margin: 12px 0;
-    padding: 14px 18px;
-    border-radius: 12px;
-    background: #ffffff;
-    border: 1px solid rgba(0,0,0,0.05);
-    box-shadow: 0 3px 8px rgba(0,0,0,0.03);
-    transition: transform 0.15s ease;
-}
-.user-guide li:hover {
-    transform: translateY(-2px);
-}
-
-.user-guide li:before {
-    counter-increment: step;
-    content: "✔";
-    background: linear-gradient(135deg,#00b4db,#0083b0);
-    color: white;
-    font-weight: bold;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    width: 26px;
-    height: 26px;
-    margin-right: 10px;
-    border-radius: 50%;
-    font-size: 14px;
-    box-shadow: 0 3px 6px rgba(0,0,0,0.1);
-}
-
-.user-guide .step-title {
-    font-weight: 600;
-    color: #08323a;
-}
-
-.user-guide .step-why {
-    display: block;
-    font-size: 13px;
-    color: #5f6f7e;
-    margin-top: 4px;
-}
-</style>
-
-<div class="user-guide">
-    <h2>📘 How to Use This Tool – Step-by-Step (Easy English)</h2>
-    <ol>
-        <li><span class="step-title">Open the app link in your browser</span>
-            <span class="step-why">Like opening a door before entering a shop.</span></li>
-        <li><span class="step-title">Read the title & short intro</span>
-            <span class="step-why">Tells you what the app does in one glance.</span></li>
-        <li><span class="step-title">Look at the sidebar on the left</span>
-            <span class="step-why">This is your control panel for the app.</span></li>
-        <li><span class="step-title">If you have a GitHub repo, type it in (optional)</span>
-            <span class="step-why">Lets the app fetch your real data.</span></li>
-        <li><span class="step-title">Turn on “Simulate” to try a demo</span>
-            <span class="step-why">Runs a fake safe example so you can see results instantly.</span></li>
-        <li><span class="step-title">Click “Fetch” to get data</span>
-            <span class="step-why">Like pressing ‘play’ to start the process.</span></li>
-        <li><span class="step-title">Check the results table</span>
-            <span class="step-why">Shows latest runs or tests for your project.</span></li>
-        <li><span class="step-title">Look at the KPIs</span>
-            <span class="step-why">Quick health check for speed & success rate.</span></li>
-        <li><span class="step-title">Play the build log</span>
-            <span class="step-why">See what happens step-by-step inside.</span></li>
-        <li><span class="step-title">View the timeline chart</span>
-            <span class="step-why">See which steps take longest.</span></li>
-        <li><span class="step-title">Check the cluster map</span>
-            <span class="step-why">Visual of how everything is connected.</span></li>
-        <li><span class="step-title">Open Docker commands</span>
-            <span class="step-why">See how the container is built & stored.</span></li>
-        <li><span class="step-title">Open Kubernetes commands</span>
-            <span class="step-why">See how deployment happens.</span></li>
-        <li><span class="step-title">If for an interview, show your README</span>
-            <span class="step-why">Explains your work to employers.</span></li>
-        <li><span class="step-title">Click slowly & explore</span>
-            <span class="step-why">Better understanding for better demos.</span></li>
-        <li><span class="step-title">Take screenshots if errors appear</span>
-            <span class="step-why">Helps in fixing & explaining issues.</span></li>
-        <li><span class="step-title">Always try the sample if unsure</span>
-            <span class="step-why">Gives a full working demo instantly.</span></li>
-        <li><span class="step-title">Explain with simple examples</span>
-            <span class="step-why">Makes it easier for non-technical people.</span></li>
-        <li><span class="step-title">You can also run it locally</span>
-            <span class="step-why">Faster and works without internet issues.</span></li>
-        <li><span class="step-title">Close the tab when done</span>
-            <span class="step-why">Keeps your session private & safe.</span></li>
-    </ol>
-</div>
-"""
-
-import streamlit as st
-st.markdown(user_guide_html, unsafe_allow_html=True)
+@st.cache_resource
+def get_user_guide_parts():
+    # constant styles/markup; read from disk once per process
+    css = Path("static/user_guide.css").read_text(encoding="utf-8")
+    html = Path("assets/user_guide.html").read_text(encoding="utf-8")
+    return css, html
+
+with st.expander("📘 How to Use This Tool – Step-by-Step (Easy English)"):
+    guide_css, guide_html = get_user_guide_parts()
+    # the style block stays its own element: its content never changes between
+    # reruns, so Streamlit's DOM differ leaves the node alone while the markup
+    # element is diffed independently
+    st.markdown(f"<style>{guide_css}</style>", unsafe_allow_html=True)
+    st.markdown(guide_html, unsafe_allow_html=True)